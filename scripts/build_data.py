@@ -4,25 +4,35 @@ This is the main entry point for `npm run data:build`.
 It processes local deck images and produces JSON artifacts for the website.
 """
 
-import json
+import asyncio
+import itertools
 import os
 import sys
 from pathlib import Path
 
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from scripts.about import resolve_about
 from scripts.classification import classify_color
-from scripts.discovery import discover_decks, deck_id_to_filename, SUPPORTED_IMAGE_EXTENSIONS
+from scripts.discovery import discover_decks, deck_id_to_filename, is_image_file
 from scripts.manifest import generate_manifest
-from scripts.ocr import OCRCache, OCRResult, ocr_card_crop
+from scripts.ocr import OCRCache, OCRResult, compute_crop_hash
 from scripts.schema import Card, DeckNode, DeckTreeIndex, LeafDeckData
-from scripts.segmentation import BBox, SegmentationError, segment_sheet
+from scripts.segmentation import (
+    BBox,
+    SegmentationError,
+    build_segmenter,
+    load_deck_configs_batch,
+)
 from scripts.translation import (
     TranslationCache,
     detect_language,
-    ensure_bilingual,
-    translate_text,
+    ensure_bilingual_async,
 )
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -30,14 +40,51 @@ DECKS_DIR = PROJECT_ROOT / "decks"
 DATA_DIR = PROJECT_ROOT / "public" / "data"
 CACHE_DIR = PROJECT_ROOT / "data_cache"
 
+# Maximum number of OCR requests in flight at once. OCR is network-bound, so
+# wall time shrinks roughly linearly up to this limit.
+OCR_CONCURRENCY = int(os.environ.get("OCR_CONCURRENCY", "8"))
+
+# Maximum number of translation requests in flight at once.
+TRANSLATION_CONCURRENCY = int(os.environ.get("TRANSLATION_CONCURRENCY", "8"))
+
+# Number of card crops packed into a single OCR request.
+OCR_BATCH_SIZE = int(os.environ.get("OCR_BATCH_SIZE", "4"))
+
+
+_anthropic_client = None
+
+
+def _get_anthropic_client():
+    """Create (once) and return the shared Anthropic client.
+
+    All providers go through one client, so its httpx connection pool keeps
+    TCP/TLS sessions alive across OCR, translation, and about-generation
+    calls instead of paying a handshake per request.
+    """
+    global _anthropic_client
+    if _anthropic_client is None:
+        import anthropic
+        import httpx
+        pool_size = OCR_CONCURRENCY + TRANSLATION_CONCURRENCY
+        _anthropic_client = anthropic.Anthropic(
+            api_key=os.environ["ANTHROPIC_API_KEY"],
+            http_client=httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                ),
+            ),
+        )
+    return _anthropic_client
+
 
 def _get_translation_provider():
     """Get the translation provider. Uses Anthropic API if available."""
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if api_key:
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            import anthropic  # noqa: F401 -- probe for the optional dependency
+            client = _get_anthropic_client()
 
             def translate_with_anthropic(text: str, target_lang: str) -> str:
                 lang_name = "Spanish" if target_lang == "es" else "English"
@@ -63,53 +110,97 @@ def _get_translation_provider():
 
 
 def _get_ocr_provider():
-    """Get the OCR provider. Uses Anthropic vision API if available."""
+    """Get the OCR provider. Uses Anthropic vision API if available.
+
+    Providers are batched: they take a list of card crops and return one
+    OCRResult per crop. The Anthropic provider packs all crops of a batch
+    into a single request to amortize per-request latency.
+    """
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if api_key:
         try:
-            import anthropic
+            import anthropic  # noqa: F401 -- probe for the optional dependency
             import base64
             import io
-            client = anthropic.Anthropic(api_key=api_key)
-
-            def ocr_with_anthropic(img: Image.Image) -> OCRResult:
-                buf = io.BytesIO()
-                img.save(buf, format="PNG")
-                b64 = base64.b64encode(buf.getvalue()).decode()
+            client = _get_anthropic_client()
+
+            def ocr_with_anthropic(imgs: list[Image.Image]) -> list[OCRResult]:
+                content = []
+                for img in imgs:
+                    buf = io.BytesIO()
+                    img.save(buf, format="PNG")
+                    b64 = base64.b64encode(buf.getvalue()).decode()
+                    content.append({
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": b64,
+                        },
+                    })
+                content.append({
+                    "type": "text",
+                    "text": f"Read the text on these {len(imgs)} cards. "
+                            "Return one line per card, in order, formatted as "
+                            "'<card number>: <card text>', numbering the cards "
+                            f"1 through {len(imgs)} in the order shown. "
+                            "If a card has no readable text, use EMPTY as its text.",
+                })
 
                 response = client.messages.create(
                     model="claude-sonnet-4-20250514",
-                    max_tokens=512,
-                    messages=[{
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": b64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": "Read the text on this card. Return only the card text, nothing else. "
-                                        "If there is no readable text, return EMPTY.",
-                            },
-                        ],
-                    }],
+                    max_tokens=512 * len(imgs),
+                    messages=[{"role": "user", "content": content}],
                 )
-                text = response.content[0].text.strip()
-                if text == "EMPTY":
-                    text = ""
-                return OCRResult(text=text, confidence=0.9)
+
+                texts: list[str | None] = [None] * len(imgs)
+                for line in response.content[0].text.splitlines():
+                    idx, sep, rest = line.partition(":")
+                    if not sep:
+                        continue
+                    try:
+                        i = int(idx.strip()) - 1
+                    except ValueError:
+                        continue
+                    if 0 <= i < len(imgs):
+                        text = rest.strip()
+                        texts[i] = "" if text == "EMPTY" else text
+                # Retry crops whose line the model dropped or misformatted as
+                # single-image requests, taking the reply verbatim. Treating
+                # them as empty would cache the parse failure as a success and
+                # silently drop the card on every future build.
+                unparsed = [i for i, t in enumerate(texts) if t is None]
+                if unparsed:
+                    print(f"    Warning: OCR batch reply yielded "
+                          f"{len(imgs) - len(unparsed)} of {len(imgs)} expected "
+                          f"card lines; retrying {len(unparsed)} individually")
+                for i in unparsed:
+                    response = client.messages.create(
+                        model="claude-sonnet-4-20250514",
+                        max_tokens=512,
+                        messages=[{
+                            "role": "user",
+                            "content": [
+                                content[i],
+                                {
+                                    "type": "text",
+                                    "text": "Read the text on this card. Return "
+                                            "only the card text, nothing else. If "
+                                            "it has no readable text, return EMPTY.",
+                                },
+                            ],
+                        }],
+                    )
+                    text = response.content[0].text.strip()
+                    texts[i] = "" if text == "EMPTY" else text
+                return [OCRResult(text=t, confidence=0.9) for t in texts]
 
             return ocr_with_anthropic
         except ImportError:
             print("Warning: anthropic package not installed, using stub OCR")
 
-    def stub_ocr(img: Image.Image) -> OCRResult:
-        return OCRResult(text="[OCR not available]", confidence=0.0)
+    def stub_ocr(imgs: list[Image.Image]) -> list[OCRResult]:
+        return [OCRResult(text="[OCR not available]", confidence=0.0) for _ in imgs]
 
     return stub_ocr
 
@@ -119,8 +210,8 @@ def _get_about_generator():
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if api_key:
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
+            import anthropic  # noqa: F401 -- probe for the optional dependency
+            client = _get_anthropic_client()
 
             def generate_with_anthropic(card_texts: list[str], language: str) -> str:
                 lang_name = "English" if language == "en" else "Spanish"
@@ -146,61 +237,124 @@ def _get_about_generator():
     return stub_generator
 
 
-def _collect_leaf_nodes(nodes: list[DeckNode]) -> list[DeckNode]:
-    """Recursively collect all leaf nodes from the tree."""
-    result: list[DeckNode] = []
-    for node in nodes:
+def _iter_leaf_nodes(nodes: list[DeckNode]):
+    """Yield all leaf nodes from the tree, depth-first.
+
+    Uses an explicit stack rather than recursion: no per-level frame or list
+    allocations, and no recursion-depth limit on deep hierarchies.
+    """
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
         if node.is_leaf:
-            result.append(node)
+            yield node
         if node.children:
-            result.extend(_collect_leaf_nodes(node.children))
-    return result
+            stack.extend(reversed(node.children))
 
 
 def _get_images(deck_dir: Path) -> list[Path]:
     """Get all image files in a deck directory, sorted by name."""
-    images = []
-    for f in sorted(deck_dir.iterdir()):
-        if f.is_file() and f.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS:
-            images.append(f)
-    return images
-
-
-def process_leaf_deck(
-    node: DeckNode,
-    ocr_cache: OCRCache,
-    translation_cache: TranslationCache,
-    ocr_provider,
-    translate_provider,
-    about_generator,
-) -> LeafDeckData:
-    """Process a single leaf deck: segment, OCR, translate, classify."""
+    with os.scandir(deck_dir) as it:
+        names = sorted(
+            entry.name for entry in it if entry.is_file() and is_image_file(entry.name)
+        )
+    return [deck_dir / name for name in names]
+
+
+async def _ocr_all(
+    entries: list[tuple[Path, Image.Image, BBox]],
+    cache: OCRCache,
+    provider,
+) -> list[OCRResult]:
+    """OCR all (image_path, image, bbox) entries, batching provider calls.
+
+    Cache hits resolve synchronously; the misses are cropped and sent to the
+    provider in groups of OCR_BATCH_SIZE, with at most OCR_CONCURRENCY
+    batches in flight at once.
+    """
+    results: list[OCRResult | None] = [None] * len(entries)
+    misses: list[tuple[int, str, Image.Image]] = []
+
+    for i, (image_path, image, bbox) in enumerate(entries):
+        crop_hash = compute_crop_hash(image_path, bbox)
+        cached = cache.get(crop_hash)
+        if cached is not None:
+            results[i] = cached
+        else:
+            crop = image.crop((bbox.x, bbox.y, bbox.x + bbox.w, bbox.y + bbox.h))
+            misses.append((i, crop_hash, crop))
+
+    sem = asyncio.Semaphore(OCR_CONCURRENCY)
+
+    async def _bounded(batch: list[tuple[int, str, Image.Image]]) -> list[OCRResult]:
+        async with sem:
+            return await asyncio.to_thread(provider, [crop for _, _, crop in batch])
+
+    batches = [misses[j:j + OCR_BATCH_SIZE] for j in range(0, len(misses), OCR_BATCH_SIZE)]
+    for batch, batch_results in zip(batches, await asyncio.gather(*(_bounded(b) for b in batches))):
+        for (i, crop_hash, _), result in zip(batch, batch_results):
+            # Zero confidence marks a crop the provider could not actually
+            # read (stub output); persisting it would pin the failure into
+            # the cache and never retry the crop with a real provider.
+            if result.confidence > 0.0:
+                cache.put(crop_hash, result)
+            results[i] = result
+
+    return results
+
+
+async def _translate_all(
+    texts: list[str],
+    source_lang: str,
+    cache: TranslationCache,
+    provider,
+) -> list[tuple[str, str]]:
+    """Translate all card texts concurrently, bounded by a semaphore."""
+    sem = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+
+    async def _bounded(text: str) -> tuple[str, str]:
+        async with sem:
+            return await ensure_bilingual_async(text, source_lang, cache, provider)
+
+    return await asyncio.gather(*(_bounded(t) for t in texts))
+
+
+async def _ocr_deck(node: DeckNode, ocr_cache: OCRCache, ocr_provider) -> list[Card]:
+    """OCR stage for one leaf deck: segment, OCR, and classify its cards."""
     deck_dir = DECKS_DIR / node.id
     images = _get_images(deck_dir)
     print(f"  Processing {node.id}: {len(images)} image(s)")
 
+    # Open each sheet once and reuse it for every crop: OCR and color
+    # classification both work from the same image. Decoding stays lazy --
+    # PIL only parses the header until a crop actually touches pixels, so a
+    # sheet whose crops are all cache hits (and yield no cards) is never
+    # decoded at all.
+    entries: list[tuple[Path, Image.Image, BBox]] = []
+    sheets: list[Image.Image] = []
     cards: list[Card] = []
-    card_idx = 0
-
-    for img_path in images:
-        try:
-            bboxes = segment_sheet(img_path, deck_dir)
-        except SegmentationError as e:
-            print(f"    Warning: {e}")
-            # Treat entire image as one card
-            with Image.open(img_path) as img:
+    segmenter = build_segmenter(deck_dir)
+    try:
+        for img_path in images:
+            img = Image.open(img_path)
+            sheets.append(img)
+            try:
+                bboxes = segmenter(img_path)
+            except SegmentationError as e:
+                print(f"    Warning: {e}")
+                # Treat entire image as one card
                 w, h = img.size
-            bboxes = [BBox(x=0, y=0, w=w, h=h)]
+                bboxes = [BBox(x=0, y=0, w=w, h=h)]
+            entries.extend((img_path, img, bbox) for bbox in bboxes)
+
+        ocr_results = await _ocr_all(entries, ocr_cache, ocr_provider)
 
-        for bbox in bboxes:
-            ocr_result = ocr_card_crop(img_path, bbox, ocr_cache, ocr_provider)
+        for card_idx, ((img_path, img, bbox), ocr_result) in enumerate(zip(entries, ocr_results)):
             if not ocr_result.text or ocr_result.text == "[OCR not available]":
-                card_idx += 1
                 continue
 
             # Classify color from the card crop
-            with Image.open(img_path) as img:
-                crop = img.crop((bbox.x, bbox.y, bbox.x + bbox.w, bbox.y + bbox.h))
+            crop = img.crop((bbox.x, bbox.y, bbox.x + bbox.w, bbox.y + bbox.h))
             color = classify_color(crop)
 
             cards.append(Card(
@@ -209,25 +363,42 @@ def process_leaf_deck(
                 text_es=ocr_result.text,
                 color=color,
             ))
-            card_idx += 1
+    finally:
+        for img in sheets:
+            img.close()
+
+    return cards
+
+
+async def _translate_deck(
+    node: DeckNode,
+    cards: list[Card],
+    translation_cache: TranslationCache,
+    translate_provider,
+    about_generator,
+) -> LeafDeckData:
+    """Translation stage for one leaf deck: detect language, translate, assemble."""
+    deck_dir = DECKS_DIR / node.id
 
     # Detect language and translate
     if cards:
-        sample_texts = [c.text_en for c in cards[:5]]
+        sample_texts = [c.text_en for c in itertools.islice(cards, 5)]
         source_lang = detect_language(sample_texts)
         print(f"    Detected language: {source_lang}")
 
-        translated_cards: list[Card] = []
-        for card in cards:
-            en, es = ensure_bilingual(card.text_en, source_lang, translation_cache, translate_provider)
-            translated_cards.append(Card(
+        translations = await _translate_all(
+            [c.text_en for c in cards], source_lang, translation_cache, translate_provider,
+        )
+        cards = [
+            Card(
                 id=card.id,
                 text_en=en,
                 text_es=es,
                 color=card.color,
                 symbol=card.symbol,
-            ))
-        cards = translated_cards
+            )
+            for card, (en, es) in zip(cards, translations)
+        ]
 
     # Resolve about text
     card_texts = [c.text_en for c in cards]
@@ -258,6 +429,93 @@ def process_leaf_deck(
     )
 
 
+def process_leaf_deck(
+    node: DeckNode,
+    ocr_cache: OCRCache,
+    translation_cache: TranslationCache,
+    ocr_provider,
+    translate_provider,
+    about_generator,
+) -> LeafDeckData:
+    """Process a single leaf deck: segment, OCR, translate, classify."""
+
+    async def _run() -> LeafDeckData:
+        cards = await _ocr_deck(node, ocr_cache, ocr_provider)
+        return await _translate_deck(
+            node, cards, translation_cache, translate_provider, about_generator
+        )
+
+    return asyncio.run(_run())
+
+
+def _dump_model_json(model) -> bytes:
+    """Serialize a pydantic model to indented JSON bytes.
+
+    Uses orjson's C encoder when available (~5-10x faster than the Python
+    indent path), falling back to pydantic's own serializer otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    return model.model_dump_json(indent=2).encode()
+
+
+# How many decks may sit between adjacent pipeline stages. Bounds memory
+# (finished-but-unwritten decks) while keeping every stage busy.
+_PIPELINE_DEPTH = 4
+
+_DONE = object()
+
+
+async def _run_pipeline(
+    leaf_nodes: list[DeckNode],
+    ocr_cache: OCRCache,
+    translation_cache: TranslationCache,
+    ocr_provider,
+    translate_provider,
+    about_generator,
+) -> None:
+    """Run the OCR -> translate -> write stages as a bounded pipeline.
+
+    Each stage is a single worker connected to the next by a bounded queue,
+    so deck N+1's OCR overlaps deck N's translation, which overlaps deck
+    N-1's serialization and disk write. Within a stage, concurrency still
+    comes from the semaphore-bounded fan-out in _ocr_all/_translate_all.
+    """
+    translate_q: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+    write_q: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+
+    async def ocr_worker() -> None:
+        for node in leaf_nodes:
+            cards = await _ocr_deck(node, ocr_cache, ocr_provider)
+            await translate_q.put((node, cards))
+        await translate_q.put(_DONE)
+
+    async def translate_worker() -> None:
+        while True:
+            item = await translate_q.get()
+            if item is _DONE:
+                await write_q.put(_DONE)
+                return
+            node, cards = item
+            deck_data = await _translate_deck(
+                node, cards, translation_cache, translate_provider, about_generator
+            )
+            await write_q.put((node, deck_data))
+
+    async def writer() -> None:
+        while True:
+            item = await write_q.get()
+            if item is _DONE:
+                return
+            node, deck_data = item
+            output_path = DATA_DIR / deck_id_to_filename(node.id)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(output_path.write_bytes, _dump_model_json(deck_data))
+            print(f"  Wrote {output_path}")
+
+    await asyncio.gather(ocr_worker(), translate_worker(), writer())
+
+
 def main() -> None:
     if not DECKS_DIR.is_dir():
         print(f"Error: {DECKS_DIR} directory not found.")
@@ -266,7 +524,7 @@ def main() -> None:
 
     print("Discovering decks...")
     index = discover_decks(DECKS_DIR)
-    leaf_nodes = _collect_leaf_nodes(index.decks)
+    leaf_nodes = list(_iter_leaf_nodes(index.decks))
 
     if not leaf_nodes:
         print("No decks with images found.")
@@ -274,38 +532,35 @@ def main() -> None:
 
     print(f"Found {len(leaf_nodes)} leaf deck(s)")
 
-    # Set up providers and caches
-    ocr_cache = OCRCache(CACHE_DIR / "ocr")
-    translation_cache = TranslationCache(CACHE_DIR / "translation")
-    ocr_provider = _get_ocr_provider()
-    translate_provider = _get_translation_provider()
-    about_generator = _get_about_generator()
+    # Prewarm the parsed-config cache with one concurrent I/O pass, so
+    # per-sheet segmentation never waits on config reads.
+    load_deck_configs_batch([DECKS_DIR / node.id for node in leaf_nodes])
 
     # Ensure output directories exist
     decks_data_dir = DATA_DIR / "decks"
     decks_data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process each leaf deck
-    for node in leaf_nodes:
-        deck_data = process_leaf_deck(
-            node, ocr_cache, translation_cache,
-            ocr_provider, translate_provider, about_generator,
-        )
-        data_file = deck_id_to_filename(node.id)
-        output_path = DATA_DIR / data_file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(deck_data.model_dump_json(indent=2))
-        print(f"  Wrote {output_path}")
+    # Stream decks through the OCR -> translate -> write pipeline so each
+    # stage works on a different deck at once. The workload is API-bound, so
+    # overlapping the stages hides most of the per-deck wall time.
+    asyncio.run(_run_pipeline(
+        leaf_nodes,
+        OCRCache(CACHE_DIR / "ocr"),
+        TranslationCache(CACHE_DIR / "translation"),
+        _get_ocr_provider(),
+        _get_translation_provider(),
+        _get_about_generator(),
+    ))
 
     # Write index.json
     index_path = DATA_DIR / "index.json"
-    index_path.write_text(index.model_dump_json(indent=2))
+    index_path.write_bytes(_dump_model_json(index))
     print(f"Wrote {index_path}")
 
-    # Write manifest
-    manifest = generate_manifest(DECKS_DIR)
+    # Write manifest, reusing the index discovered above
+    manifest = generate_manifest(DECKS_DIR, index=index)
     manifest_path = DATA_DIR / "deck-manifest.json"
-    manifest_path.write_text(manifest.model_dump_json(indent=2))
+    manifest_path.write_bytes(_dump_model_json(manifest))
     print(f"Wrote {manifest_path}")
 
     print("Done!")
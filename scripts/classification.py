@@ -2,6 +2,7 @@
 
 import colorsys
 
+import numpy as np
 from PIL import Image
 
 # Named color palette: maps color name to representative (H, S, V) ranges.
@@ -19,6 +20,11 @@ COLOR_PALETTE: dict[str, tuple[int, int, int]] = {
     "gray": (0, 0, 50),
 }
 
+# Palette unpacked into parallel arrays so classification can compute all
+# distances in one vectorized expression.
+_PALETTE_NAMES = list(COLOR_PALETTE)
+_PALETTE_HSV = np.array(list(COLOR_PALETTE.values()), dtype=np.float32)
+
 
 def _rgb_to_hsv_360(r: int, g: int, b: int) -> tuple[float, float, float]:
     """Convert RGB (0-255) to HSV with H in 0-360, S and V in 0-100."""
@@ -27,47 +33,29 @@ def _rgb_to_hsv_360(r: int, g: int, b: int) -> tuple[float, float, float]:
 
 
 def _dominant_color(img: Image.Image) -> tuple[int, int, int]:
-    """Get the dominant RGB color of an image by averaging all pixels."""
-    small = img.resize((50, 50))
-    rgb = small.convert("RGB")
-    pixels = list(rgb.tobytes())
-    # Convert flat byte list to (R, G, B) tuples
-    pixel_tuples = [(pixels[i], pixels[i + 1], pixels[i + 2]) for i in range(0, len(pixels), 3)]
-    if not pixel_tuples:
-        return (128, 128, 128)
-    r = sum(p[0] for p in pixel_tuples) // len(pixel_tuples)
-    g = sum(p[1] for p in pixel_tuples) // len(pixel_tuples)
-    b = sum(p[2] for p in pixel_tuples) // len(pixel_tuples)
-    return (r, g, b)
-
-
-def _hsv_distance(h1: float, s1: float, v1: float, h2: float, s2: float, v2: float) -> float:
-    """Compute distance between two HSV colors, accounting for hue wrapping."""
-    # Handle achromatic colors (low saturation)
-    if s1 < 15 or s2 < 15:
-        # For near-gray colors, mostly compare value
-        return abs(v1 - v2) + abs(s1 - s2) * 0.5
+    """Get the dominant RGB color of an image by averaging all pixels.
 
-    # Hue distance (circular)
-    hue_diff = abs(h1 - h2)
-    if hue_diff > 180:
-        hue_diff = 360 - hue_diff
-
-    return hue_diff * 1.0 + abs(s1 - s2) * 0.5 + abs(v1 - v2) * 0.3
+    A 1x1 box-filter resize computes exactly the per-channel mean in PIL's
+    C backend, so no pixel data ever reaches Python.
+    """
+    return img.convert("RGB").resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
 
 
 def classify_color(img: Image.Image) -> str:
-    """Classify the dominant color of an image into a named palette color."""
+    """Classify the dominant color of an image into a named palette color.
+
+    Distances to all palette entries are computed in one vectorized
+    expression, accounting for hue wrapping; achromatic pairs (low
+    saturation) compare mostly on value instead of hue.
+    """
     r, g, b = _dominant_color(img)
     h, s, v = _rgb_to_hsv_360(r, g, b)
 
-    best_name = "gray"
-    best_dist = float("inf")
-
-    for name, (ph, ps, pv) in COLOR_PALETTE.items():
-        d = _hsv_distance(h, s, v, ph, ps, pv)
-        if d < best_dist:
-            best_dist = d
-            best_name = name
+    ph, ps, pv = _PALETTE_HSV[:, 0], _PALETTE_HSV[:, 1], _PALETTE_HSV[:, 2]
+    hue_diff = np.abs(ph - h)
+    hue_diff = np.minimum(hue_diff, 360.0 - hue_diff)
+    chromatic = hue_diff + 0.5 * np.abs(ps - s) + 0.3 * np.abs(pv - v)
+    achromatic = np.abs(pv - v) + 0.5 * np.abs(ps - s)
+    dists = np.where((ps < 15) | (s < 15), achromatic, chromatic)
 
-    return best_name
+    return _PALETTE_NAMES[int(dists.argmin())]
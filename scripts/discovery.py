@@ -1,10 +1,22 @@
 """Deck discovery: scan directory tree and build deck index."""
 
+import functools
+import os
 from pathlib import Path
 
 from scripts.schema import DeckNode, DeckTreeIndex
 
-SUPPORTED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".heic"}
+SUPPORTED_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".heic"})
+
+
+def is_image_file(name: str) -> bool:
+    """Check a bare filename for a supported image extension.
+
+    Splits once and lowercases only the extension tail, avoiding Path and
+    suffix allocations in directory-scan hot loops.
+    """
+    _, sep, ext = name.rpartition(".")
+    return bool(sep) and "." + ext.lower() in SUPPORTED_IMAGE_EXTENSIONS
 
 
 def deck_id_to_filename(deck_id: str) -> str:
@@ -17,12 +29,16 @@ def _dir_name_to_display(name: str) -> str:
     return name.replace("-", " ").replace("_", " ").title()
 
 
+@functools.lru_cache(maxsize=None)
 def _has_images(directory: Path) -> bool:
-    """Check if a directory directly contains any supported image files."""
-    for f in directory.iterdir():
-        if f.is_file() and f.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS:
-            return True
-    return False
+    """Check if a directory directly contains any supported image files.
+
+    Memoized for the process lifetime: discovery runs for both the index and
+    the manifest in a single build, and the probe result for a directory does
+    not change mid-run.
+    """
+    with os.scandir(directory) as it:
+        return any(entry.is_file() and is_image_file(entry.name) for entry in it)
 
 
 def _build_tree(directory: Path, base_path: Path) -> DeckNode | None:
@@ -1,66 +1,125 @@
 """Manifest fingerprinting and staleness detection."""
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from scripts.discovery import SUPPORTED_IMAGE_EXTENSIONS, deck_id_to_filename, discover_decks
-from scripts.schema import DeckManifest, DeckManifestEntry, DeckNode
+from scripts.discovery import deck_id_to_filename, discover_decks, is_image_file
+from scripts.schema import DeckFileStat, DeckManifest, DeckManifestEntry, DeckNode, DeckTreeIndex
 
 # Files that contribute to a deck's fingerprint (besides images).
-FINGERPRINT_EXTRAS = {"deck.config.json", "about.txt", "about.en.txt", "about.es.txt"}
+FINGERPRINT_EXTRAS = frozenset({"deck.config.json", "about.txt", "about.en.txt", "about.es.txt"})
+
+# Chunk size for streaming file contents into a hash (1 MiB). Keeps peak
+# memory flat regardless of image size.
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _update_hash_from_file(h, path: Path) -> None:
+    """Stream a file's contents into a hash object in fixed-size chunks."""
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+
+
+# Process-lifetime digest cache: path -> (size, mtime_ns, digest). A build
+# fingerprints each deck for the manifest after staleness checks already
+# hashed it; unchanged stat metadata lets the second pass skip the read.
+_FILE_DIGEST_CACHE: dict[str, tuple[int, int, bytes]] = {}
+
+
+def _hash_file(path: Path) -> bytes:
+    """Compute the SHA-256 digest of a single file, reusing cached digests
+    for files whose size and mtime have not changed since the last call."""
+    st = path.stat()
+    key = str(path)
+    cached = _FILE_DIGEST_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    h = hashlib.sha256()
+    _update_hash_from_file(h, path)
+    digest = h.digest()
+    _FILE_DIGEST_CACHE[key] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _relevant_files(deck_dir: Path) -> list[Path]:
+    """Collect the files that contribute to a deck's fingerprint, sorted by name."""
+    with os.scandir(deck_dir) as it:
+        names = sorted(
+            entry.name
+            for entry in it
+            if entry.is_file()
+            and (is_image_file(entry.name) or entry.name in FINGERPRINT_EXTRAS)
+        )
+    return [deck_dir / name for name in names]
+
+
+def _deck_file_stats(deck_dir: Path) -> list[DeckFileStat]:
+    """Collect (name, size, mtime_ns) metadata for a deck's relevant files."""
+    stats: list[DeckFileStat] = []
+    for f in _relevant_files(deck_dir):
+        st = f.stat()
+        stats.append(DeckFileStat(name=f.name, size=st.st_size, mtime_ns=st.st_mtime_ns))
+    return stats
 
 
 def compute_deck_fingerprint(deck_dir: Path) -> str:
     """Compute a SHA-256 fingerprint for a leaf deck directory.
 
-    Includes content hashes of all image files, config files, and about files,
-    sorted by name for determinism.
+    Per-file digests of all image files, config files, and about files are
+    computed concurrently (hashlib releases the GIL, so I/O and SHA compute
+    overlap), then folded into the fingerprint in sorted name order for
+    determinism.
     """
+    relevant_files = _relevant_files(deck_dir)
+
     h = hashlib.sha256()
+    with ThreadPoolExecutor() as executor:
+        for f, digest in zip(relevant_files, executor.map(_hash_file, relevant_files)):
+            h.update(f.name.encode())
+            h.update(digest)
 
-    relevant_files: list[Path] = []
-    for f in sorted(deck_dir.iterdir()):
-        if not f.is_file():
-            continue
-        if f.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS:
-            relevant_files.append(f)
-        elif f.name in FINGERPRINT_EXTRAS:
-            relevant_files.append(f)
+    return h.hexdigest()
 
-    for f in relevant_files:
-        h.update(f.name.encode())
-        h.update(f.read_bytes())
 
-    return h.hexdigest()
+def _iter_leaf_decks(nodes: list[DeckNode], decks_dir: Path):
+    """Yield (deck_id, path) for all leaf decks, depth-first.
 
+    Uses an explicit stack rather than recursion: no per-level frame or list
+    allocations, and no recursion-depth limit on deep hierarchies.
+    """
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if node.is_leaf:
+            yield node.id, decks_dir / node.id
+        if node.children:
+            stack.extend(reversed(node.children))
 
-def _collect_leaf_decks(node: DeckNode, decks_dir: Path) -> list[tuple[str, Path]]:
-    """Collect all leaf deck IDs and their filesystem paths."""
-    results: list[tuple[str, Path]] = []
-    if node.is_leaf:
-        results.append((node.id, decks_dir / node.id.replace("/", "/")))
-    if node.children:
-        for child in node.children:
-            results.extend(_collect_leaf_decks(child, decks_dir))
-    return results
 
+def generate_manifest(decks_dir: Path, index: DeckTreeIndex | None = None) -> DeckManifest:
+    """Generate a manifest with fingerprints for all leaf decks.
 
-def generate_manifest(decks_dir: Path) -> DeckManifest:
-    """Generate a manifest with fingerprints for all leaf decks."""
-    index = discover_decks(decks_dir)
+    Callers that have already discovered the tree can pass the index to
+    avoid a second directory walk.
+    """
+    if index is None:
+        index = discover_decks(decks_dir)
     entries: list[DeckManifestEntry] = []
 
-    for deck_node in index.decks:
-        for deck_id, deck_path in _collect_leaf_decks(deck_node, decks_dir):
-            fp = compute_deck_fingerprint(deck_path)
-            entries.append(
-                DeckManifestEntry(
-                    deck_id=deck_id,
-                    fingerprint=fp,
-                    data_file=deck_id_to_filename(deck_id),
-                )
+    for deck_id, deck_path in _iter_leaf_decks(index.decks, decks_dir):
+        fp = compute_deck_fingerprint(deck_path)
+        entries.append(
+            DeckManifestEntry(
+                deck_id=deck_id,
+                fingerprint=fp,
+                data_file=deck_id_to_filename(deck_id),
+                files=_deck_file_stats(deck_path),
             )
+        )
 
     return DeckManifest(entries=entries)
 
@@ -87,12 +146,15 @@ class StalenessResult:
 def check_staleness(decks_dir: Path, data_dir: Path) -> StalenessResult:
     """Compare current deck state against committed manifest.
 
+    Decks whose (name, size, mtime_ns) metadata matches the committed
+    manifest are considered unchanged without re-reading any file contents;
+    the content fingerprint is only computed to confirm a suspected change.
+
     Args:
         decks_dir: Path to the local decks/ directory.
         data_dir: Path to the committed data directory (public/data/).
     """
     result = StalenessResult()
-    current = generate_manifest(decks_dir)
 
     manifest_path = data_dir / "deck-manifest.json"
     if not manifest_path.exists():
@@ -102,21 +164,29 @@ def check_staleness(decks_dir: Path, data_dir: Path) -> StalenessResult:
         committed = DeckManifest.model_validate(json.loads(manifest_path.read_text()))
 
     committed_map = {e.deck_id: e for e in committed.entries}
-    current_map = {e.deck_id: e for e in current.entries}
 
-    for deck_id, entry in current_map.items():
-        if deck_id not in committed_map:
+    index = discover_decks(decks_dir)
+    current_leaves = dict(_iter_leaf_decks(index.decks, decks_dir))
+
+    for deck_id, deck_path in current_leaves.items():
+        entry = committed_map.get(deck_id)
+        if entry is None:
             result.new_decks.append(deck_id)
-        elif entry.fingerprint != committed_map[deck_id].fingerprint:
-            result.changed_decks.append(deck_id)
+            continue
+
+        # Stat-only fast path: unchanged metadata means unchanged content.
+        if entry.files is not None and _deck_file_stats(deck_path) == entry.files:
+            changed = False
         else:
-            # Check that the data file actually exists
-            data_file = data_dir / entry.data_file
-            if not data_file.exists():
-                result.missing_data_files.append(deck_id)
+            changed = compute_deck_fingerprint(deck_path) != entry.fingerprint
+
+        if changed:
+            result.changed_decks.append(deck_id)
+        elif not (data_dir / entry.data_file).exists():
+            result.missing_data_files.append(deck_id)
 
     for deck_id in committed_map:
-        if deck_id not in current_map:
+        if deck_id not in current_leaves:
             result.removed_decks.append(deck_id)
 
     return result
@@ -1,7 +1,9 @@
 """OCR module with content-hash caching."""
 
+import functools
 import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Callable
@@ -22,36 +24,84 @@ class OCRResult:
 # A provider takes a PIL Image and returns an OCRResult.
 OCRProvider = Callable[[Image.Image], OCRResult]
 
+# Batch variant: takes several card crops and returns one OCRResult per crop,
+# in order. Lets API-backed providers pack multiple images into one request.
+OCRBatchProvider = Callable[[list[Image.Image]], list[OCRResult]]
+
 
 class OCRCache:
-    """File-based cache for OCR results, keyed by content hash."""
+    """File-based cache for OCR results, keyed by content hash.
+
+    Results are also kept in a bounded in-memory LRU layer so warm lookups
+    are dict hits rather than file reads plus JSON parses.
+    """
+
+    _MEM_CAP = 10_000
 
     def __init__(self, cache_dir: Path) -> None:
         self._dir = cache_dir
         self._dir.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[str, OCRResult] = OrderedDict()
 
     def _path(self, key: str) -> Path:
         return self._dir / f"{key}.json"
 
+    def _remember(self, key: str, result: OCRResult) -> None:
+        self._mem[key] = result
+        self._mem.move_to_end(key)
+        if len(self._mem) > self._MEM_CAP:
+            self._mem.popitem(last=False)
+
     def get(self, key: str) -> OCRResult | None:
+        cached = self._mem.get(key)
+        if cached is not None:
+            self._mem.move_to_end(key)
+            return cached
         path = self._path(key)
         if not path.exists():
             return None
         data = json.loads(path.read_text())
-        return OCRResult(text=data["text"], confidence=data["confidence"])
+        result = OCRResult(text=data["text"], confidence=data["confidence"])
+        self._remember(key, result)
+        return result
 
     def put(self, key: str, result: OCRResult) -> None:
         path = self._path(key)
         path.write_text(json.dumps(asdict(result)))
+        self._remember(key, result)
+
+
+# Chunk size for streaming image contents into the hash (1 MiB).
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=1024)
+def _sheet_hash_cached(path_str: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha256()
+    with open(path_str, "rb") as fp:
+        for chunk in iter(lambda: fp.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def compute_sheet_hash(image_path: Path) -> str:
+    """Compute the content hash of a sheet image.
+
+    Memoized on (path, size, mtime_ns), so a sheet with many bboxes is only
+    read and hashed once; edits to the file invalidate the entry.
+    """
+    st = image_path.stat()
+    return _sheet_hash_cached(str(image_path), st.st_size, st.st_mtime_ns)
 
 
 def compute_crop_hash(image_path: Path, bbox: BBox) -> str:
     """Compute a hash uniquely identifying a card crop.
 
-    Based on the image file content and the bounding box.
+    Combines the (memoized) sheet content hash with the bounding box, so
+    hashing N crops of one sheet reads the file once instead of N times.
     """
     h = hashlib.sha256()
-    h.update(image_path.read_bytes())
+    h.update(compute_sheet_hash(image_path).encode())
     h.update(f"{bbox.x},{bbox.y},{bbox.w},{bbox.h}".encode())
     return h.hexdigest()
 
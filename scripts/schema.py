@@ -65,12 +65,24 @@ class DeckTreeIndex(BaseModel):
     decks: list[DeckNode]
 
 
+class DeckFileStat(BaseModel):
+    """Stat metadata for one source file of a deck.
+
+    Lets staleness checks skip re-hashing decks whose files are unchanged.
+    """
+
+    name: str
+    size: int
+    mtime_ns: int
+
+
 class DeckManifestEntry(BaseModel):
     """One entry in the deck manifest tracking source fingerprints."""
 
     deck_id: str
     fingerprint: str
     data_file: str
+    files: list[DeckFileStat] | None = None
 
 
 class DeckManifest(BaseModel):
@@ -1,10 +1,14 @@
 """Card segmentation: split sheet images into individual card regions."""
 
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, NamedTuple
 
+import numpy as np
 from PIL import Image
+from pydantic import BaseModel, Field
 
 
 class SegmentationError(Exception):
@@ -12,9 +16,13 @@ class SegmentationError(Exception):
     pass
 
 
-@dataclass(frozen=True)
-class BBox:
-    """Bounding box for a card region (x, y, width, height)."""
+class BBox(NamedTuple):
+    """Bounding box for a card region (x, y, width, height).
+
+    A NamedTuple rather than a dataclass: tuple layout keeps instances at
+    a fraction of the size (no per-instance __dict__), which matters when
+    dense sheets allocate thousands of boxes.
+    """
     x: int
     y: int
     w: int
@@ -23,78 +31,206 @@ class BBox:
 
 @dataclass
 class DeckConfig:
-    """Configuration for card segmentation loaded from deck.config.json."""
+    """Configuration for card segmentation loaded from deck.config.json.
+
+    Explicit bboxes are held as an (N, 4) int32 array rather than N BBox
+    objects, so configs with hundreds of boxes materialize as one block of
+    memory; BBox wrapping is deferred until a caller actually needs it.
+    """
     grid: tuple[int, int] | None = None  # (rows, cols)
-    bboxes: list[BBox] | None = None
+    bboxes: np.ndarray | None = None  # (N, 4) int32 rows of (x, y, w, h)
     symbol_roi: tuple[int, int, int, int] | None = None  # (x, y, w, h)
 
+    @property
+    def bboxes_as_objs(self) -> list[BBox] | None:
+        """Bboxes materialized as BBox tuples, built on demand."""
+        if self.bboxes is None:
+            return None
+        return [BBox(*map(int, row)) for row in self.bboxes]
+
 
 def load_deck_config(deck_dir: Path) -> DeckConfig | None:
-    """Load deck.config.json from a deck directory if it exists."""
+    """Load deck.config.json from a deck directory if it exists.
+
+    Parsed configs are memoized on (path, mtime_ns), so segmenting many
+    sheets from the same deck re-reads the file only after an edit.
+    """
     config_path = deck_dir / "deck.config.json"
     if not config_path.exists():
         return None
 
-    raw = json.loads(config_path.read_text())
-    config = DeckConfig()
+    return _load_deck_config_cached(str(config_path), config_path.stat().st_mtime_ns)
 
-    if "grid" in raw:
-        rows, cols = raw["grid"]
-        config.grid = (int(rows), int(cols))
 
-    if "bboxes" in raw:
-        config.bboxes = [
-            BBox(x=int(b[0]), y=int(b[1]), w=int(b[2]), h=int(b[3]))
-            for b in raw["bboxes"]
-        ]
+def load_deck_configs_batch(
+    deck_dirs: list[Path], max_workers: int = 16
+) -> dict[Path, DeckConfig | None]:
+    """Load deck configs for many directories with one concurrent I/O pass.
 
-    if "symbolRoi" in raw:
-        r = raw["symbolRoi"]
-        config.symbol_roi = (int(r[0]), int(r[1]), int(r[2]), int(r[3]))
+    The stat/read syscalls overlap across a thread pool, so wall time scales
+    with the slowest file rather than the sum -- worthwhile on network
+    mounts. Results land in the per-config cache, making later
+    load_deck_config calls dict hits.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(deck_dirs, executor.map(load_deck_config, deck_dirs)))
 
-    return config
+
+class _DeckConfigModel(BaseModel):
+    """Validated shape of deck.config.json.
+
+    Parsing and coercion happen once in pydantic-core rather than through
+    per-element int() casts; the model stays private since the config file
+    is an input, not a published artifact like the models in schema.py.
+    """
+    grid: tuple[int, int] | None = None
+    bboxes: list[tuple[int, int, int, int]] | None = None
+    symbol_roi: tuple[int, int, int, int] | None = Field(default=None, alias="symbolRoi")
+
+
+@functools.lru_cache(maxsize=256)
+def _load_deck_config_cached(path_str: str, mtime_ns: int) -> DeckConfig:
+    model = _DeckConfigModel.model_validate_json(Path(path_str).read_bytes())
+    return DeckConfig(
+        grid=model.grid,
+        bboxes=(
+            np.asarray(model.bboxes, dtype=np.int32).reshape(-1, 4)
+            if model.bboxes is not None
+            else None
+        ),
+        symbol_roi=model.symbol_roi,
+    )
 
 
 def compute_grid_bboxes(rows: int, cols: int, width: int, height: int) -> list[BBox]:
-    """Compute bounding boxes for a regular grid layout."""
+    """Compute bounding boxes for a regular grid layout.
+
+    Coordinates are generated with a NumPy broadcast rather than a Python
+    double loop, so dense sheets (10x10+) pay only for the final BBox
+    materialization.
+    """
     cell_w = width // cols
     cell_h = height // rows
-    bboxes: list[BBox] = []
-    for row in range(rows):
-        for col in range(cols):
-            bboxes.append(BBox(
-                x=col * cell_w,
-                y=row * cell_h,
-                w=cell_w,
-                h=cell_h,
-            ))
-    return bboxes
+    xs = np.arange(cols, dtype=np.int32) * cell_w
+    ys = np.arange(rows, dtype=np.int32) * cell_h
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    return [
+        BBox(x=int(x), y=int(y), w=cell_w, h=cell_h)
+        for x, y in zip(grid_x.ravel(), grid_y.ravel())
+    ]
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _parse_jpeg_dimensions(fp) -> tuple[int, int] | None:
+    """Scan JPEG markers for the SOF segment and return (width, height)."""
+    fp.seek(2)
+    while True:
+        marker = fp.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        while code == 0xFF:  # fill bytes before a marker
+            nxt = fp.read(1)
+            if not nxt:
+                return None
+            code = nxt[0]
+        # Standalone markers (RSTn, TEM) carry no length field.
+        if code == 0x01 or 0xD0 <= code <= 0xD9:
+            continue
+        size = fp.read(2)
+        if len(size) < 2:
+            return None
+        length = int.from_bytes(size, "big")
+        if length < 2:
+            # A segment length below 2 (or a truncated read mapping to 0)
+            # would seek backwards and loop forever; treat as corrupt.
+            return None
+        # SOF0-SOF15, excluding the DHT/JPG/DAC markers in the same range.
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            data = fp.read(5)
+            if len(data) < 5:
+                return None
+            height = int.from_bytes(data[1:3], "big")
+            width = int.from_bytes(data[3:5], "big")
+            return width, height
+        fp.seek(length - 2, 1)
 
 
 def _get_image_dimensions(image_path: Path) -> tuple[int, int]:
-    """Get image width and height."""
-    with Image.open(image_path) as img:
+    """Get image width and height.
+
+    Results are memoized on (path, mtime_ns), so repeated segmentation of
+    the same sheet parses its header once.
+    """
+    return _dims_cached(str(image_path), image_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1024)
+def _dims_cached(path_str: str, mtime_ns: int) -> tuple[int, int]:
+    # PNG and JPEG dimensions are read straight from the file header (a few
+    # dozen bytes) without constructing a PIL decoder; other formats (HEIC)
+    # and unparseable files fall back to Image.open.
+    try:
+        with open(path_str, "rb") as fp:
+            head = fp.read(26)
+            if head.startswith(_PNG_SIGNATURE) and head[12:16] == b"IHDR":
+                width = int.from_bytes(head[16:20], "big")
+                height = int.from_bytes(head[20:24], "big")
+                return width, height
+            if head[:2] == b"\xff\xd8":
+                dims = _parse_jpeg_dimensions(fp)
+                if dims is not None:
+                    return dims
+    except OSError:
+        pass
+
+    with Image.open(path_str) as img:
         return img.size  # (width, height)
 
 
-def segment_sheet(image_path: Path, deck_dir: Path) -> list[BBox]:
-    """Segment a sheet image into card bounding boxes.
+def build_segmenter(deck_dir: Path, as_array: bool = False) -> Callable:
+    """Build a segmentation function specialized for one deck's config.
 
-    Uses config if available, otherwise attempts heuristic segmentation.
+    The strategy branch (explicit bboxes / grid / fail) is decided once here;
+    the returned closure only does the per-sheet work, so batch callers
+    processing thousands of sheets skip the config dispatch per call.
     """
     config = load_deck_config(deck_dir)
 
-    if config and config.bboxes:
-        return config.bboxes
+    if config and config.bboxes is not None:
+        bboxes = config.bboxes if as_array else config.bboxes_as_objs
+        return lambda _image_path: bboxes
 
     if config and config.grid:
         rows, cols = config.grid
-        width, height = _get_image_dimensions(image_path)
-        return compute_grid_bboxes(rows, cols, width, height)
-
-    # Heuristic fallback - not yet implemented
-    raise SegmentationError(
-        f"Could not automatically segment '{image_path.name}'. "
-        f"Please provide a deck.config.json in '{deck_dir}' with either "
-        f"a 'grid' (e.g. [3, 3]) or explicit 'bboxes' definitions."
-    )
+
+        def _segment_grid(image_path: Path):
+            width, height = _get_image_dimensions(image_path)
+            grid = compute_grid_bboxes(rows, cols, width, height)
+            return np.asarray(grid, dtype=np.int32) if as_array else grid
+
+        return _segment_grid
+
+    def _fail(image_path: Path):
+        # Heuristic fallback - not yet implemented
+        raise SegmentationError(
+            f"Could not automatically segment '{image_path.name}'. "
+            f"Please provide a deck.config.json in '{deck_dir}' with either "
+            f"a 'grid' (e.g. [3, 3]) or explicit 'bboxes' definitions."
+        )
+
+    return _fail
+
+
+def segment_sheet(image_path: Path, deck_dir: Path, as_array: bool = False):
+    """Segment a sheet image into card bounding boxes.
+
+    Uses config if available, otherwise attempts heuristic segmentation.
+    Returns a list of BBox tuples, or the raw (N, 4) int32 coordinate array
+    when `as_array` is set -- hot callers can crop with `tuple(row)` without
+    constructing BBox objects at all. Batch callers segmenting many sheets
+    from one deck should use build_segmenter directly.
+    """
+    return build_segmenter(deck_dir, as_array=as_array)(image_path)
@@ -1,7 +1,13 @@
 """Translation module with caching and language detection."""
 
+import asyncio
+import functools
 import hashlib
 import json
+import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Callable
 
@@ -10,55 +16,120 @@ TranslationProvider = Callable[[str, str], str]
 
 
 class TranslationCache:
-    """File-based cache for translations, keyed by (text_hash, target_lang)."""
+    """File-based cache for translations, keyed by (text_hash, target_lang).
+
+    Entries are sharded into 256 subdirectories by the first two hex chars
+    of the hash (the git/cacache layout), so lookups stay constant-time on
+    filesystems whose flat-directory performance degrades with entry count.
+
+    Results are also kept in a bounded in-memory LRU layer, so repeat
+    lookups within one run are dict hits instead of filesystem round-trips.
+    """
+
+    _MEM_CAP = 4096
 
     def __init__(self, cache_dir: Path) -> None:
         self._dir = cache_dir
         self._dir.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._mem_lock = threading.Lock()
 
     def _path(self, text_hash: str, target_lang: str) -> Path:
-        return self._dir / f"{text_hash}_{target_lang}.txt"
+        return self._dir / text_hash[:2] / f"{text_hash[2:]}_{target_lang}.txt"
+
+    def _remember(self, key: tuple[str, str], translated: str) -> None:
+        with self._mem_lock:
+            self._mem[key] = translated
+            self._mem.move_to_end(key)
+            if len(self._mem) > self._MEM_CAP:
+                self._mem.popitem(last=False)
 
     def get(self, text_hash: str, target_lang: str) -> str | None:
+        key = (text_hash, target_lang)
+        with self._mem_lock:
+            cached = self._mem.get(key)
+            if cached is not None:
+                self._mem.move_to_end(key)
+                return cached
+
         path = self._path(text_hash, target_lang)
-        if not path.exists():
-            return None
-        return path.read_text(encoding="utf-8")
+        if path.exists():
+            translated = path.read_bytes().decode("utf-8")
+            self._remember(key, translated)
+            return translated
+
+        return None
 
     def put(self, text_hash: str, target_lang: str, translated: str) -> None:
         path = self._path(text_hash, target_lang)
-        path.write_text(translated, encoding="utf-8")
+        path.parent.mkdir(exist_ok=True)
+        # Write to a sibling temp file and publish with an atomic rename, so
+        # a crash mid-write can never leave a truncated cache entry behind.
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(translated.encode("utf-8"))
+        os.replace(tmp, path)
+        self._remember((text_hash, target_lang), translated)
+
+
+# Bound once so _text_hash skips the module attribute lookup per call.
+_blake2b = hashlib.blake2b
 
 
 def _text_hash(text: str) -> str:
-    return hashlib.sha256(text.encode()).hexdigest()
+    # Cache keys only disambiguate filenames, so a keyed non-cryptographic
+    # hash is enough. BLAKE2b at 16 bytes is much cheaper per call than
+    # SHA-256 and halves the filename length.
+    return _blake2b(text.encode(), digest_size=16).hexdigest()
 
 
 # Simple heuristic: Spanish-common characters and words
-_SPANISH_INDICATORS = {
+_SPANISH_INDICATORS = frozenset({
     "que", "de", "el", "la", "los", "las", "un", "una", "es", "en",
     "por", "con", "para", "como", "tu", "te", "mi", "su", "nos",
-}
+})
+
+# All indicators compiled into one alternation: the regex engine scans each
+# sample in a single pass whose cost is independent of dictionary size, so
+# the wordlist can grow without adding per-token lookups. Longest-first
+# ordering keeps alternatives unambiguous.
+_INDICATOR_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(_SPANISH_INDICATORS, key=len, reverse=True)) + r")\b"
+)
 
 
 def detect_language(samples: list[str]) -> str:
     """Detect whether card text samples are primarily English or Spanish.
 
-    Uses a simple word-frequency heuristic. Returns 'en' or 'es'.
+    Uses a simple word-frequency heuristic. Returns 'en' or 'es'. Results
+    are memoized per sample tuple, so repeated detection over the same deck
+    within one process is a dict hit.
     """
+    return _detect_language_cached(tuple(samples))
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_language_cached(samples: tuple[str, ...]) -> str:
     if not samples:
         return "en"
 
     spanish_score = 0
     total_words = 0
 
+    # Accumulate per sample and stop as soon as the decision is clear: once
+    # enough words have been seen, an indicator ratio well above or well
+    # below the 15% threshold cannot be flipped by typical remaining text,
+    # so large decks resolve after a few samples instead of a full scan.
     for sample in samples:
-        words = sample.lower().split()
-        for word in words:
-            clean = word.strip(".,;:!?()\"'")
-            total_words += 1
-            if clean in _SPANISH_INDICATORS:
-                spanish_score += 1
+        lowered = sample.lower()
+        total_words += len(lowered.split())
+        spanish_score += len(_INDICATOR_RE.findall(lowered))
+
+        if total_words >= 50:
+            ratio = spanish_score / total_words
+            if ratio > 0.25:
+                return "es"
+            if ratio < 0.05:
+                return "en"
 
     if total_words == 0:
         return "en"
@@ -103,3 +174,40 @@ def ensure_bilingual(
     else:
         translated = translate_text(text, "en", cache, provider)
         return translated, text
+
+
+async def translate_text_async(
+    text: str,
+    target_lang: str,
+    cache: TranslationCache,
+    provider: TranslationProvider,
+) -> str:
+    """Async variant of translate_text for concurrent dispatch.
+
+    Cache hits resolve synchronously; on a miss the (blocking) provider call
+    runs in a worker thread via asyncio.to_thread so many translations can be
+    in flight at once.
+    """
+    th = _text_hash(text)
+    cached = cache.get(th, target_lang)
+    if cached is not None:
+        return cached
+
+    translated = await asyncio.to_thread(provider, text, target_lang)
+    cache.put(th, target_lang, translated)
+    return translated
+
+
+async def ensure_bilingual_async(
+    text: str,
+    source_lang: str,
+    cache: TranslationCache,
+    provider: TranslationProvider,
+) -> tuple[str, str]:
+    """Async variant of ensure_bilingual. Returns (english_text, spanish_text)."""
+    if source_lang == "en":
+        translated = await translate_text_async(text, "es", cache, provider)
+        return text, translated
+    else:
+        translated = await translate_text_async(text, "en", cache, provider)
+        return translated, text
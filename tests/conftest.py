@@ -0,0 +1,15 @@
+"""Shared pytest configuration for the pipeline test suite."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """Group tests by module for pytest-xdist.
+
+    The modules share no mutable state, so `pytest -n auto --dist loadgroup`
+    can fan them out across workers; grouping per module keeps each worker's
+    pydantic core schemas and session fixtures warm. The marker is inert
+    when xdist is not installed.
+    """
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=item.module.__name__))
@@ -1,7 +1,5 @@
 """Tests for color and symbol classification."""
 
-from pathlib import Path
-
 import pytest
 from PIL import Image
 
@@ -11,51 +9,53 @@ from scripts.classification import (
 )
 
 
-def _make_solid_image(path: Path, color: tuple[int, int, int], size: tuple[int, int] = (100, 100)) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    img = Image.new("RGB", size, color=color)
-    img.save(str(path))
+@pytest.fixture(scope="session")
+def color_images() -> dict[str, Image.Image]:
+    """Solid-color test images, built once and shared across tests."""
+    swatches = {
+        "red": (220, 30, 30),
+        "blue": (30, 30, 220),
+        "green": (30, 180, 30),
+        "yellow": (230, 230, 30),
+        "purple": (150, 30, 200),
+        "orange": (240, 140, 20),
+        "white": (250, 250, 250),
+        "black": (15, 15, 15),
+    }
+    return {name: Image.new("RGB", (4, 4), color=rgb) for name, rgb in swatches.items()}
 
 
 class TestClassifyColor:
-    def test_red_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(220, 30, 30))
-        assert classify_color(img) == "red"
+    def test_red_card(self, color_images):
+        assert classify_color(color_images["red"]) == "red"
 
-    def test_blue_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(30, 30, 220))
-        assert classify_color(img) == "blue"
+    def test_blue_card(self, color_images):
+        assert classify_color(color_images["blue"]) == "blue"
 
-    def test_green_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(30, 180, 30))
-        assert classify_color(img) == "green"
+    def test_green_card(self, color_images):
+        assert classify_color(color_images["green"]) == "green"
 
-    def test_yellow_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(230, 230, 30))
-        assert classify_color(img) == "yellow"
+    def test_yellow_card(self, color_images):
+        assert classify_color(color_images["yellow"]) == "yellow"
 
-    def test_purple_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(150, 30, 200))
-        assert classify_color(img) == "purple"
+    def test_purple_card(self, color_images):
+        assert classify_color(color_images["purple"]) == "purple"
 
-    def test_orange_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(240, 140, 20))
-        assert classify_color(img) == "orange"
+    def test_orange_card(self, color_images):
+        assert classify_color(color_images["orange"]) == "orange"
 
-    def test_white_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(250, 250, 250))
-        assert classify_color(img) == "white"
+    def test_white_card(self, color_images):
+        assert classify_color(color_images["white"]) == "white"
 
-    def test_black_card(self, tmp_path: Path):
-        img = Image.new("RGB", (100, 100), color=(15, 15, 15))
-        assert classify_color(img) == "black"
+    def test_black_card(self, color_images):
+        assert classify_color(color_images["black"]) == "black"
 
     def test_palette_has_expected_colors(self):
         expected = {"red", "blue", "green", "yellow", "purple", "orange", "white", "black", "pink"}
         assert expected.issubset(set(COLOR_PALETTE.keys()))
 
     def test_classify_returns_string(self):
-        img = Image.new("RGB", (50, 50), color=(128, 128, 128))
+        img = Image.new("RGB", (4, 4), color=(128, 128, 128))
         result = classify_color(img)
         assert isinstance(result, str)
         assert result in COLOR_PALETTE
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from scripts.discovery import discover_decks, deck_id_to_filename
-from scripts.schema import DeckNode, DeckTreeIndex
+from scripts.schema import DeckTreeIndex
 
 
 @pytest.fixture
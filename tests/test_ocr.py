@@ -16,7 +16,7 @@ from scripts.ocr import (
 from scripts.segmentation import BBox
 
 
-def _make_test_image(path: Path, width: int = 100, height: int = 100) -> None:
+def _make_test_image(path: Path, width: int = 8, height: int = 8) -> None:
     from PIL import Image
     path.parent.mkdir(parents=True, exist_ok=True)
     img = Image.new("RGB", (width, height), color=(200, 200, 200))
@@ -26,7 +26,7 @@ def _make_test_image(path: Path, width: int = 100, height: int = 100) -> None:
 class TestComputeCropHash:
     def test_returns_hex_string(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         bbox = BBox(x=0, y=0, w=100, h=100)
         h = compute_crop_hash(img_path, bbox)
         assert isinstance(h, str)
@@ -34,7 +34,7 @@ class TestComputeCropHash:
 
     def test_same_crop_same_hash(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         bbox = BBox(x=0, y=0, w=100, h=100)
         h1 = compute_crop_hash(img_path, bbox)
         h2 = compute_crop_hash(img_path, bbox)
@@ -42,7 +42,7 @@ class TestComputeCropHash:
 
     def test_different_bbox_different_hash(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         h1 = compute_crop_hash(img_path, BBox(x=0, y=0, w=100, h=100))
         h2 = compute_crop_hash(img_path, BBox(x=100, y=0, w=100, h=100))
         assert h1 != h2
@@ -82,7 +82,7 @@ class TestOCRCache:
 class TestOcrCardCrop:
     def test_uses_cache_on_hit(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         bbox = BBox(x=0, y=0, w=100, h=100)
         cache = OCRCache(tmp_path / "cache")
         crop_hash = compute_crop_hash(img_path, bbox)
@@ -96,7 +96,7 @@ class TestOcrCardCrop:
 
     def test_calls_provider_on_miss(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         bbox = BBox(x=0, y=0, w=100, h=100)
         cache = OCRCache(tmp_path / "cache")
 
@@ -108,7 +108,7 @@ class TestOcrCardCrop:
 
     def test_provider_result_cached(self, tmp_path: Path):
         img_path = tmp_path / "img.jpg"
-        _make_test_image(img_path, 200, 200)
+        _make_test_image(img_path)
         bbox = BBox(x=0, y=0, w=100, h=100)
         cache = OCRCache(tmp_path / "cache")
 
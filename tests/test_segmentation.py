@@ -1,11 +1,24 @@
 """Tests for card segmentation from sheet images."""
 
+import functools
 import json
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
 from scripts.segmentation import (
     BBox,
     DeckConfig,
@@ -19,14 +32,14 @@ from scripts.segmentation import (
 class TestDeckConfig:
     def test_load_grid_config(self, tmp_path: Path):
         config_path = tmp_path / "deck.config.json"
-        config_path.write_text(json.dumps({"grid": [3, 3]}))
+        config_path.write_bytes(_dumps({"grid": [3, 3]}))
         config = load_deck_config(tmp_path)
         assert config is not None
         assert config.grid == (3, 3)
 
     def test_load_bboxes_config(self, tmp_path: Path):
         config_path = tmp_path / "deck.config.json"
-        config_path.write_text(json.dumps({
+        config_path.write_bytes(_dumps({
             "bboxes": [[0, 0, 100, 100], [100, 0, 200, 100]]
         }))
         config = load_deck_config(tmp_path)
@@ -40,7 +53,7 @@ class TestDeckConfig:
 
     def test_config_with_symbol_roi(self, tmp_path: Path):
         config_path = tmp_path / "deck.config.json"
-        config_path.write_text(json.dumps({
+        config_path.write_bytes(_dumps({
             "grid": [2, 2],
             "symbolRoi": [10, 10, 50, 50]
         }))
@@ -49,26 +62,59 @@ class TestDeckConfig:
         assert config.symbol_roi == (10, 10, 50, 50)
 
 
+def _as_array(bboxes) -> np.ndarray:
+    """BBoxes as an (N, 4) array for one-shot comparison."""
+    return np.asarray(bboxes, dtype=np.int32).reshape(-1, 4)
+
+
+def _ref_bboxes(rows: int, cols: int, width: int, height: int) -> list[tuple[int, int, int, int]]:
+    """Expected grid from the closed form, computed one cell at a time.
+
+    Deliberately a plain Python loop, independent of the meshgrid
+    implementation under test, so it can catch coordinate bugs there.
+    """
+    cell_w = width // cols
+    cell_h = height // rows
+    return [
+        (col * cell_w, row * cell_h, cell_w, cell_h)
+        for row in range(rows)
+        for col in range(cols)
+    ]
+
+
 class TestComputeGridBboxes:
     def test_2x2_grid(self):
         bboxes = compute_grid_bboxes(rows=2, cols=2, width=200, height=200)
-        assert len(bboxes) == 4
-        assert bboxes[0] == BBox(x=0, y=0, w=100, h=100)
-        assert bboxes[1] == BBox(x=100, y=0, w=100, h=100)
-        assert bboxes[2] == BBox(x=0, y=100, w=100, h=100)
-        assert bboxes[3] == BBox(x=100, y=100, w=100, h=100)
+        expected = [
+            (0, 0, 100, 100),
+            (100, 0, 100, 100),
+            (0, 100, 100, 100),
+            (100, 100, 100, 100),
+        ]
+        np.testing.assert_array_equal(_as_array(bboxes), expected)
 
     def test_3x3_grid(self):
         bboxes = compute_grid_bboxes(rows=3, cols=3, width=300, height=300)
-        assert len(bboxes) == 9
-        assert bboxes[0] == BBox(x=0, y=0, w=100, h=100)
-        assert bboxes[8] == BBox(x=200, y=200, w=100, h=100)
+        expected = [
+            (x, y, 100, 100) for y in (0, 100, 200) for x in (0, 100, 200)
+        ]
+        np.testing.assert_array_equal(_as_array(bboxes), expected)
 
     def test_1x1_grid(self):
         bboxes = compute_grid_bboxes(rows=1, cols=1, width=500, height=300)
         assert len(bboxes) == 1
         assert bboxes[0] == BBox(x=0, y=0, w=500, h=300)
 
+    @pytest.mark.parametrize(
+        ("rows", "cols", "width", "height"),
+        [(2, 2, 200, 200), (3, 3, 300, 300), (5, 7, 641, 503), (10, 10, 1000, 1000)],
+    )
+    def test_matches_closed_form_reference(self, rows, cols, width, height):
+        bboxes = compute_grid_bboxes(rows=rows, cols=cols, width=width, height=height)
+        np.testing.assert_array_equal(
+            _as_array(bboxes), _ref_bboxes(rows, cols, width, height)
+        )
+
     def test_non_even_division(self):
         bboxes = compute_grid_bboxes(rows=2, cols=3, width=301, height=201)
         assert len(bboxes) == 6
@@ -77,23 +123,31 @@ class TestComputeGridBboxes:
         assert bboxes[0].h == 100
 
 
+@functools.lru_cache(maxsize=None)
+def _sample_image_bytes(width: int = 200, height: int = 200) -> bytes:
+    """Encode a white test image once per (width, height); tests copy bytes."""
+    try:
+        import io
+
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (width, height), color=(255, 255, 255)).save(buf, format="JPEG")
+        return buf.getvalue()
+    except ImportError:
+        # If PIL not available, write dummy bytes and mock image loading
+        return b"fake image"
+
+
 class TestSegmentSheet:
     def _make_test_image(self, path: Path, width: int = 200, height: int = 200) -> None:
         """Create a minimal valid image file for testing."""
-        # Create a simple BMP file (easiest to construct without PIL)
-        # BMP header for a small image
         path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            from PIL import Image
-            img = Image.new("RGB", (width, height), color=(255, 255, 255))
-            img.save(str(path))
-        except ImportError:
-            # If PIL not available, write dummy bytes and mock image loading
-            path.write_bytes(b"fake image")
+        path.write_bytes(_sample_image_bytes(width, height))
 
     def test_segment_with_grid_config(self, tmp_path: Path):
         config_path = tmp_path / "deck.config.json"
-        config_path.write_text(json.dumps({"grid": [2, 2]}))
+        config_path.write_bytes(_dumps({"grid": [2, 2]}))
         img_path = tmp_path / "sheet.jpg"
         self._make_test_image(img_path, 200, 200)
 
@@ -102,7 +156,7 @@ class TestSegmentSheet:
 
     def test_segment_with_explicit_bboxes(self, tmp_path: Path):
         config_path = tmp_path / "deck.config.json"
-        config_path.write_text(json.dumps({
+        config_path.write_bytes(_dumps({
             "bboxes": [[0, 0, 100, 100], [100, 0, 200, 100]]
         }))
         img_path = tmp_path / "sheet.jpg"
@@ -113,8 +167,10 @@ class TestSegmentSheet:
         assert bboxes[0] == BBox(x=0, y=0, w=100, h=100)
 
     def test_segment_no_config_uses_heuristic(self, tmp_path: Path):
+        # segment_sheet raises before ever opening the image, so an empty
+        # file stands in for a real encode.
         img_path = tmp_path / "sheet.jpg"
-        self._make_test_image(img_path)
+        img_path.write_bytes(b"")
 
         # Heuristic is a stub that raises SegmentationError for now
         with pytest.raises(SegmentationError, match="provide a deck.config.json"):
@@ -8,31 +8,59 @@ import pytest
 
 from scripts.translation import (
     TranslationCache,
+    _text_hash,
     detect_language,
     translate_text,
     ensure_bilingual,
 )
 
 
+# Expected cache keys for fixed strings, derived once at import time.
+_HELLO_HASH = _text_hash("Hello world")
+_SOURCE_HASH = _text_hash("Source text")
+
+
+class _Spy:
+    """Minimal provider stand-in: records calls without MagicMock overhead."""
+
+    def __init__(self, ret: str) -> None:
+        self.ret = ret
+        self.calls: list[tuple] = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return self.ret
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    """Cache directory derived from tmp_path once per test."""
+    d = tmp_path / "cache"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture
+def cache(cache_dir: Path) -> TranslationCache:
+    """Fresh file-backed cache; shared by tests that don't test construction."""
+    return TranslationCache(cache_dir)
+
+
 class TestTranslationCache:
-    def test_cache_miss(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
+    def test_cache_miss(self, cache: TranslationCache):
         assert cache.get("abc", "es") is None
 
-    def test_cache_hit_after_put(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
+    def test_cache_hit_after_put(self, cache: TranslationCache):
         cache.put("abc", "es", "Hola mundo")
         assert cache.get("abc", "es") == "Hola mundo"
 
-    def test_different_target_langs_independent(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
+    def test_different_target_langs_independent(self, cache: TranslationCache):
         cache.put("abc", "es", "Spanish")
         cache.put("abc", "en", "English")
         assert cache.get("abc", "es") == "Spanish"
         assert cache.get("abc", "en") == "English"
 
-    def test_cache_persists_across_instances(self, tmp_path: Path):
-        cache_dir = tmp_path / "cache"
+    def test_cache_persists_across_instances(self, cache_dir: Path):
         c1 = TranslationCache(cache_dir)
         c1.put("hash1", "es", "Persisted")
         c2 = TranslationCache(cache_dir)
@@ -65,61 +93,51 @@ class TestDetectLanguage:
 
 
 class TestTranslateText:
-    def test_translation_with_cache_miss(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
-        mock_provider = MagicMock(return_value="Hola mundo")
+    def test_translation_with_cache_miss(self, cache: TranslationCache):
+        provider = _Spy("Hola mundo")
 
-        result = translate_text("Hello world", "es", cache, mock_provider)
+        result = translate_text("Hello world", "es", cache, provider)
         assert result == "Hola mundo"
-        mock_provider.assert_called_once_with("Hello world", "es")
+        assert provider.calls == [("Hello world", "es")]
 
-    def test_translation_with_cache_hit(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
+    def test_translation_with_cache_hit(self, cache: TranslationCache):
         # Pre-populate cache
-        import hashlib
-        text_hash = hashlib.sha256("Hello world".encode()).hexdigest()
-        cache.put(text_hash, "es", "Cached translation")
+        cache.put(_HELLO_HASH, "es", "Cached translation")
 
         mock_provider = MagicMock()
         result = translate_text("Hello world", "es", cache, mock_provider)
         assert result == "Cached translation"
         mock_provider.assert_not_called()
 
-    def test_translation_result_cached(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
-        mock_provider = MagicMock(return_value="Translated")
+    def test_translation_result_cached(self, cache: TranslationCache):
+        provider = _Spy("Translated")
 
-        translate_text("Source text", "es", cache, mock_provider)
+        translate_text("Source text", "es", cache, provider)
 
-        import hashlib
-        text_hash = hashlib.sha256("Source text".encode()).hexdigest()
-        assert cache.get(text_hash, "es") == "Translated"
+        assert cache.get(_SOURCE_HASH, "es") == "Translated"
 
 
 class TestEnsureBilingual:
-    def test_english_source_adds_spanish(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
-        mock_provider = MagicMock(return_value="Hola")
+    def test_english_source_adds_spanish(self, cache: TranslationCache):
+        provider = _Spy("Hola")
 
-        en, es = ensure_bilingual("Hello", "en", cache, mock_provider)
+        en, es = ensure_bilingual("Hello", "en", cache, provider)
         assert en == "Hello"
         assert es == "Hola"
-        mock_provider.assert_called_once_with("Hello", "es")
+        assert provider.calls == [("Hello", "es")]
 
-    def test_spanish_source_adds_english(self, tmp_path: Path):
-        cache = TranslationCache(tmp_path / "cache")
-        mock_provider = MagicMock(return_value="Hello")
+    def test_spanish_source_adds_english(self, cache: TranslationCache):
+        provider = _Spy("Hello")
 
-        en, es = ensure_bilingual("Hola", "es", cache, mock_provider)
+        en, es = ensure_bilingual("Hola", "es", cache, provider)
         assert en == "Hello"
         assert es == "Hola"
-        mock_provider.assert_called_once_with("Hola", "en")
+        assert provider.calls == [("Hola", "en")]
 
-    def test_no_translation_when_same_target(self, tmp_path: Path):
+    def test_no_translation_when_same_target(self, cache: TranslationCache):
         """If source is already bilingual-ready, still translate to other lang."""
-        cache = TranslationCache(tmp_path / "cache")
-        mock_provider = MagicMock(return_value="Translated")
+        provider = _Spy("Translated")
 
-        en, es = ensure_bilingual("Text", "en", cache, mock_provider)
+        en, es = ensure_bilingual("Text", "en", cache, provider)
         assert en == "Text"
         assert es == "Translated"